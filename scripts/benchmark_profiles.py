@@ -0,0 +1,134 @@
+"""Compare default and lean browser profile on a local fixture page
+
+Serves a page resembling a GitHub view (time element, avatars, web font,
+slow third-party tracker) from a local server and measures page-load
+time and bytes transferred for both profiles. The page is served from
+127.0.0.1 while "localhost" acts as third-party host.
+"""
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+import statistics
+import threading
+import time
+
+from selenium import webdriver  # type: ignore
+from selenium.webdriver.common.by import By  # type: ignore
+from selenium.webdriver.support.ui import WebDriverWait  # type: ignore
+from selenium.webdriver.support import expected_conditions as EC  # type: ignore
+
+from sitewatcher.profiles import LeanProfile
+
+
+FIRST_PARTY = "127.0.0.1"
+THIRD_PARTY = "localhost"
+N_AVATARS = 10
+RES_SIZE = 100 * 1024
+RES_DELAY = 0.2  # seconds, per image/font/tracker response
+TIMESTAMP_XPATH = "//BODY/DIV/MAIN/DIV/RELATIVE-TIME"
+
+PAGE = """<!DOCTYPE html>
+<html><head>
+<style>@font-face {{ font-family: f; src: url(/font.woff2); }}
+body {{ font-family: f; }}</style>
+<script src="http://{third}:{port}/tracker.js"></script>
+</head><body><div><main><div>
+<relative-time datetime="2022-03-17T12:00:00Z">Mar 17, 2022</relative-time>
+</div>{avatars}</main></div></body></html>
+"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves the fixture page and counts bytes sent"""
+    def do_GET(self):  # pylint: disable=invalid-name
+        path = self.path.split("?")[0]
+        if path == "/":
+            port = self.server.server_address[1]
+            avatars = "".join(f'<img src="/avatar/{i}.png">'
+                              for i in range(N_AVATARS))
+            body = PAGE.format(third=THIRD_PARTY, port=port,
+                               avatars=avatars).encode()
+            ctype = "text/html"
+        elif path.startswith("/avatar/") or path == "/font.woff2":
+            time.sleep(RES_DELAY)
+            body = os.urandom(RES_SIZE)
+            ctype = "application/octet-stream"
+        elif path == "/tracker.js":
+            time.sleep(RES_DELAY)
+            body = b"/*" + b"x" * RES_SIZE + b"*/"
+            ctype = "text/javascript"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.lock:
+            self.server.bytes_sent += len(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+class FixtureServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__((FIRST_PARTY, 0), FixtureHandler)
+        self.lock = threading.Lock()
+        self.bytes_sent = 0
+
+    def reset(self) -> int:
+        with self.lock:
+            sent, self.bytes_sent = self.bytes_sent, 0
+        return sent
+
+
+def measure(server: FixtureServer, lean: bool, rounds: int):
+    options = webdriver.FirefoxOptions()
+    options.add_argument("-headless")
+    profile = LeanProfile(allowed_hosts=[FIRST_PARTY]) if lean else None
+    if profile:
+        profile.apply(options)
+    browser = webdriver.Firefox(options=options)
+    if profile:
+        profile.set_viewport(browser)  # as done by the watcher
+    url = f"http://{FIRST_PARTY}:{server.server_address[1]}/"
+    times, transferred = [], []
+    try:
+        for _ in range(rounds):
+            browser.get("about:blank")
+            time.sleep(RES_DELAY)  # let pending requests of last round finish
+            server.reset()
+            start = time.perf_counter()
+            browser.get(url)
+            WebDriverWait(browser, 10).until(
+                EC.presence_of_element_located((By.XPATH, TIMESTAMP_XPATH)))
+            times.append(time.perf_counter() - start)
+            time.sleep(RES_DELAY)  # count stragglers of the eager load too
+            transferred.append(server.reset())
+    finally:
+        browser.quit()
+    return times, transferred
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", "--rounds", type=int, default=5,
+                        help="Page loads per profile")
+    args = parser.parse_args()
+    server = FixtureServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        print(f"{'profile':8} {'load time (s)':>14} {'transferred (KiB)':>18}")
+        for name, lean in (("default", False), ("lean", True)):
+            times, transferred = measure(server, lean, args.rounds)
+            print(f"{name:8} {statistics.median(times):14.3f}"
+                  f" {statistics.median(transferred) / 1024:18.1f}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
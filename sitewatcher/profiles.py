@@ -0,0 +1,83 @@
+"""Browser profiles"""
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+from urllib.parse import quote
+
+from selenium import webdriver  # type: ignore
+from selenium.webdriver.remote.webdriver import WebDriver  # type: ignore
+
+
+# hosts needed to render GitHub views incl. the scripts defining time elements
+GH_HOSTS = ["github.com", "api.github.com", "github.githubassets.com"]
+# unroutable proxy to make blocked requests fail fast
+BLOCKING_PROXY = "PROXY 127.0.0.1:9"
+
+
+@dataclass
+class LeanProfile:
+    """Firefox profile skipping resources not needed to locate timestamps
+
+    Blocks images, web fonts, media and every host not exactly matching
+    one of `allowed_hosts` (e.g. the analytics host collector.github.com).
+    Pages are handed over once the DOM is ready instead of waiting for
+    the full load event.
+    """
+    allowed_hosts: Optional[List[str]] = field(
+        default_factory=lambda: list(GH_HOSTS))
+    block_images: bool = True
+    block_fonts: bool = True
+    block_media: bool = True
+    page_load_strategy: str = "eager"
+    viewport: Optional[Tuple[int, int]] = (1280, 1024)
+
+    def apply(self, options: webdriver.FirefoxOptions) -> None:
+        options.page_load_strategy = self.page_load_strategy
+        options.set_preference("network.prefetch-next", False)
+        options.set_preference("network.dns.disablePrefetch", True)
+        if self.block_images:
+            options.set_preference("permissions.default.image", 2)
+        if self.block_fonts:
+            options.set_preference("gfx.downloadable_fonts.enabled", False)
+            options.set_preference("browser.display.use_document_fonts", 0)
+        if self.block_media:
+            options.set_preference("media.autoplay.default", 5)
+            options.set_preference("media.preload.default", 0)
+            options.set_preference("media.preload.auto", 0)
+        if self.allowed_hosts is not None:
+            # route requests via PAC, so that only allowed hosts go DIRECT
+            options.set_preference("network.proxy.type", 2)
+            options.set_preference("network.proxy.autoconfig_url",
+                                   "data:text/javascript," +
+                                   quote(self.pac_script()))
+            options.set_preference(
+                "network.proxy.allow_hijacking_localhost", True)
+            # do not retry DIRECT once the blocking proxy failed
+            options.set_preference("network.proxy.failover_direct", False)
+
+    def set_viewport(self, driver: WebDriver) -> None:
+        if self.viewport:
+            driver.set_window_size(*self.viewport)
+
+    def allows(self, host: str) -> bool:
+        """Whether requests to host pass the host blocking"""
+        if self.allowed_hosts is None:
+            return True
+        return host.lower() in self._normalized_hosts()
+
+    def pac_script(self) -> str:
+        """Proxy auto-config blocking all but the allowed hosts
+
+        Implements allows() as lookup of the lower-cased host.
+        """
+        hosts = ", ".join(f'"{h}": true' for h in self._normalized_hosts())
+        return (
+            "function FindProxyForURL(url, host) {"
+            f" var allowed = {{{hosts}}};"
+            " if (allowed.hasOwnProperty(host.toLowerCase()))"
+            " return 'DIRECT';"
+            f" return '{BLOCKING_PROXY}';"
+            "}"
+        )
+
+    def _normalized_hosts(self) -> List[str]:
+        return [host.lower() for host in self.allowed_hosts or []]
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from datetime import date
 from typing import Callable, List, Optional, Tuple
 
-from selenium.webdriver.chrome.webdriver import WebDriver  # type: ignore
+from selenium.webdriver.remote.webdriver import WebDriver  # type: ignore
 import yaml  # type: ignore
 
 
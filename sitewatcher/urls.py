@@ -3,8 +3,9 @@
 from dataclasses import dataclass, field
 import enum
 import functools
+import random
 import re
-from typing import Any, List, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import yaml  # type: ignore
 
@@ -36,6 +37,19 @@ yaml.add_representer(ViewType, ViewType.representer)
 yaml.add_constructor('!VIEWTYPE', ViewType.constructor)
 
 
+@dataclass
+class Sample(yaml.YAMLObject):
+    """Additional example target of a view.
+
+    Unlike the main example, a sample is only checked for the timestamps
+    listed by name, as other pages need not show all of them.
+    """
+    yaml_tag = "!SAMPLE"
+    params: List[Any] = field(default_factory=list)
+    repo: Optional[str] = None  # only for repo views, default: EXAMPLE_REPO
+    timestamps: List[str] = field(default_factory=list)
+
+
 @dataclass
 class View(yaml.YAMLObject):
     """Site view as defined by a url pattern."""
@@ -46,19 +60,53 @@ class View(yaml.YAMLObject):
     example_params: List[Any] = field(default_factory=list)
     type: ViewType = ViewType.REPO
     login: bool = False
+    lean: bool = True  # False if timestamps depend on blocked resources
     timestamps: List[TS] = field(default_factory=list)
+    samples: List[Sample] = field(default_factory=list)
 
     @property
     def pattern(self) -> re.Pattern:
         return re.compile(self.regex)
 
     def example_url(self, suffix_only=False) -> str:
-        suffix = self.template.format(*self.example_params)
+        return self._build_url(self.example_params, None, suffix_only)
+
+    def sample_url(self, sample: Sample, suffix_only=False) -> str:
+        return self._build_url(sample.params, sample.repo, suffix_only)
+
+    def sample_targets(self, samples: Optional[Sequence[Sample]] = None,
+                       suffix_only=False) -> Dict[str, Optional[Sample]]:
+        """Distinct URLs of the main example (None) and the given samples.
+
+        Uses all additional samples of the view if samples is None.
+        """
+        if samples is None:
+            samples = self.samples
+        targets: Dict[str, Optional[Sample]] = {
+            self.example_url(suffix_only): None}
+        for sample in samples:
+            targets.setdefault(self.sample_url(sample, suffix_only), sample)
+        return targets
+
+    def sample_urls(self, samples: Optional[Sequence[Sample]] = None,
+                    suffix_only=False) -> List[str]:
+        return list(self.sample_targets(samples, suffix_only))
+
+    def expected_timestamps(self, sample: Optional[Sample]) -> List[TS]:
+        """Timestamps to find on the main example (None) or a sample"""
+        if sample is None:
+            return self.timestamps
+        return [tsp for tsp in self.timestamps
+                if tsp.name in sample.timestamps]
+
+    def _build_url(self, params: Sequence[Any], repo: Optional[str],
+                   suffix_only: bool) -> str:
+        suffix = self.template.format(*params)
         if suffix_only:
             return suffix
         return self._urljoin(
             GH,
-            EXAMPLE_REPO if self.type is ViewType.REPO else "",
+            (repo or EXAMPLE_REPO) if self.type is ViewType.REPO else "",
             suffix,
         )
 
@@ -79,3 +127,24 @@ class View(yaml.YAMLObject):
                 return a + b
             return "/".join((a, b))
         return functools.reduce(_join, parts)
+
+
+def schedule(views: Iterable[View], max_samples: Optional[int] = None,
+             rng: Optional[random.Random] = None
+             ) -> Dict[str, List[Tuple[View, Optional[Sample]]]]:
+    """Group views by the distinct URLs that need to be loaded.
+
+    Every view is scheduled with its main example (sample None). Of the
+    additional samples at most `max_samples` randomly chosen ones are
+    included (all if None). Views sharing a URL are grouped so that the
+    page is loaded only once.
+    """
+    rng = rng or random.Random()
+    plan: Dict[str, List[Tuple[View, Optional[Sample]]]] = {}
+    for view in views:
+        samples = view.samples
+        if max_samples is not None and len(samples) > max_samples:
+            samples = rng.sample(samples, max_samples)
+        for url, sample in view.sample_targets(samples).items():
+            plan.setdefault(url, []).append((view, sample))
+    return plan
@@ -2,12 +2,13 @@
 import itertools
 import logging
 import os
-from typing import Sequence
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
 import unittest
 
 from pkg_resources import resource_stream  # type: ignore
 from selenium import webdriver  # type: ignore
-from selenium.webdriver.chrome.webdriver import WebDriver  # type: ignore
+from selenium.webdriver.remote.webdriver import WebDriver  # type: ignore
 from selenium.webdriver.remote.webelement import WebElement  # type: ignore
 import selenium.common.exceptions as selex  # type: ignore
 from selenium.webdriver.common.by import By  # type: ignore
@@ -15,7 +16,8 @@ from selenium.webdriver.support.ui import WebDriverWait  # type: ignore
 from selenium.webdriver.support import expected_conditions as EC  # type: ignore
 import yaml  # type: ignore
 
-from sitewatcher.urls import View
+from sitewatcher.profiles import LeanProfile
+from sitewatcher.urls import Sample, View, schedule
 
 
 logger = logging.getLogger("watcher")
@@ -27,14 +29,23 @@ logger.addHandler(ch)
 
 class SiteWatcherTest(unittest.TestCase):
     browser: WebDriver
+    browsers: Dict[bool, WebDriver]
     gui: bool
+    lean: Optional[LeanProfile]
+    max_samples: Optional[int]
+    seed: int
 
     @classmethod
     def setUpClass(cls):
-        options = webdriver.FirefoxOptions()
         cls.gui = bool(os.environ.get("SITEWATCHER_GUI", None))
-        options.headless = not cls.gui
-        cls.browser = webdriver.Firefox(options=options)
+        cls.lean = (LeanProfile() if os.environ.get("SITEWATCHER_LEAN", None)
+                    else None)
+        samples = os.environ.get("SITEWATCHER_SAMPLES", None)
+        cls.max_samples = int(samples) if samples else None
+        seed = os.environ.get("SITEWATCHER_SEED", None)
+        cls.seed = int(seed) if seed else random.randrange(2**32)
+        cls.browsers = {}
+        cls.browser = cls.get_browser()
         # load view and timestamp data
         with resource_stream('sitewatcher.resources', "views.yaml") as views_fp:
             cls.views = yaml.load(views_fp, yaml.Loader)
@@ -42,13 +53,53 @@ class SiteWatcherTest(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
         # do not close browser if in GUI mode / not headless
-        if cls.browser and not cls.gui:
-            cls.browser.close()
+        if not cls.gui:
+            for browser in cls.browsers.values():
+                browser.close()
+
+    @classmethod
+    def get_browser(cls, lean=True) -> WebDriver:
+        """Get browser with lean profile (if enabled) or default profile"""
+        profile = cls.lean if lean else None
+        key = profile is not None
+        if key not in cls.browsers:
+            options = webdriver.FirefoxOptions()
+            if not cls.gui:
+                options.add_argument("-headless")
+            if profile:
+                profile.apply(options)
+            cls.browsers[key] = webdriver.Firefox(options=options)
+            if profile:
+                profile.set_viewport(cls.browsers[key])
+        return cls.browsers[key]
 
     def test_views(self):
-        for view in self.views:
-            with self.subTest(view=view.name):
-                self.watch_view(view)
+        views = [v for v in self.views if self.is_watchable(v)]
+        plan = schedule(views, max_samples=self.max_samples,
+                        rng=random.Random(self.seed))
+        if self.max_samples is not None:
+            # log sample choice to be able to reproduce failures
+            logger.info("Sampling with SITEWATCHER_SEED=%d", self.seed)
+            for url, targets in plan.items():
+                logger.info("Scheduled %s (%s)", url,
+                            ",".join(v.name for v, _ in targets))
+        for url, targets in plan.items():
+            with self.subTest(view=",".join(v.name for v, _ in targets),
+                              url=url):
+                # opt out of lean profile if any view depends on blocked res.
+                self.browser = self.get_browser(
+                    all(v.lean for v, _ in targets))
+                self.watch_url(url, targets)
+
+    @staticmethod
+    def is_watchable(view: View) -> bool:
+        if not view.timestamps:
+            return False  # nothing to check
+        if view.login:
+            # login not supported yet
+            logger.debug("Skipping views %s (login only)", view.name)
+            return False
+        return True
 
     def wait_for_element(self, xpath: str, timeout=10, panic=True,
                          clickable=False) -> WebElement:
@@ -62,15 +113,23 @@ class SiteWatcherTest(unittest.TestCase):
             if panic:
                 self.fail("Timeout waiting for timestamp to appear")
 
-    def watch_view(self, view: View) -> None:
-        timestamps = view.timestamps
-        if not timestamps:
-            return  # nothing to check
-        if view.login:
-            # login not supported yet
-            logger.debug("Skipping views %s (login only)", view.name)
-            return
-        url = view.example_url()
+    def wait_for_complete(self, timeout=10) -> None:
+        def is_complete(driver: WebDriver) -> bool:
+            return driver.execute_script(
+                "return document.readyState") == "complete"
+        try:
+            WebDriverWait(self.browser, timeout).until(is_complete)
+        except selex.TimeoutException:
+            logger.warning("Page not completely loaded (%s), scan may miss"
+                           " late timestamps", self.browser.current_url)
+
+    def watch_url(self, url: str,
+                  targets: List[Tuple[View, Optional[Sample]]]) -> None:
+        """Load url once and check the timestamps of all given views
+
+        Views loaded with a sample (not None) are only checked for the
+        timestamps listed by the sample.
+        """
         logger.debug("Loading %s ...", url)
         self.browser.get(url)
         with self.assertRaises(selex.NoSuchElementException, msg="404"):
@@ -81,8 +140,14 @@ class SiteWatcherTest(unittest.TestCase):
             base_url = cur_url.split("?")[0]
             self.assertEqual(base_url, url, "Loaded url differs significantly")
 
+        # check timestamps which alter the page (trigger, prepare) last,
+        # so that the page state is unaltered for all others
+        checks = [(view, tsp) for view, sample in targets
+                  for tsp in view.expected_timestamps(sample)]
+        checks.sort(key=lambda c: bool(c[1].trigger or c[1].prepare))
+        window = None  # size before prepare steps (e.g. resizing)
         # look for each timestamp based on its xpath
-        for tsp in timestamps:
+        for view, tsp in checks:
             if not tsp.is_active():
                 # skipping no longer active timestamps
                 continue
@@ -91,8 +156,10 @@ class SiteWatcherTest(unittest.TestCase):
                 logger.debug("Skipping ts %s (login only)", tsp.name)
                 continue
             logger.debug("Searching %s ...", tsp.name)
-            with self.subTest(timestamp=tsp.name):
+            with self.subTest(view=view.name, timestamp=tsp.name):
                 if tsp.prepare:
+                    if window is None:
+                        window = self.browser.get_window_size()
                     tsp.prepare(self.browser)
                 if tsp.trigger:
                     for trig in tsp.trigger:
@@ -115,7 +182,23 @@ class SiteWatcherTest(unittest.TestCase):
             logger.debug("Successfully found %s on %s (n=%d)",
                          tsp.name, view.name, len(els))
 
-        # look for unexpected, uncatalogued timestamps
+        try:
+            # sample pages may show timestamps outside of the catalogue
+            if any(sample is None for _, sample in targets):
+                self.check_unexpected([view for view, _ in targets])
+            else:
+                logger.debug("Skipping uncatalogued scan on sample %s", url)
+        finally:
+            # undo resizing of prepare steps (utils.shrink_and_scroll_down),
+            # so that later URLs are loaded with the initial window size
+            if window is not None:
+                self.browser.set_window_size(window["width"],
+                                             window["height"])
+
+    def check_unexpected(self, views: List[View]) -> None:
+        """Look for unexpected, uncatalogued timestamps on current page"""
+        # wait for full load, as the lean profile loads pages eagerly
+        self.wait_for_complete()
         time_elements = self.browser.find_elements(
             By.CSS_SELECTOR,
             "time-ago, relative-time, local-time"
@@ -130,7 +213,7 @@ class SiteWatcherTest(unittest.TestCase):
         expected = set(filter(filter_timeelements,
                               itertools.chain.from_iterable(
             # only expect time-elements, no custom timestamps in spans
-            ts.all_xpaths_rel() for ts in view.timestamps
+            ts.all_xpaths_rel() for view in views for ts in view.timestamps
             if ts.is_active()
         )))
         for found in found_xpaths:
@@ -0,0 +1,86 @@
+import unittest
+from urllib.parse import unquote
+
+from selenium import webdriver  # type: ignore
+
+from sitewatcher.profiles import BLOCKING_PROXY, GH_HOSTS, LeanProfile
+
+
+def apply(profile: LeanProfile) -> webdriver.FirefoxOptions:
+    options = webdriver.FirefoxOptions()
+    profile.apply(options)
+    return options
+
+
+class HostBlockingTest(unittest.TestCase):
+    """Check which hosts pass the host blocking."""
+    def test_allowed(self) -> None:
+        profile = LeanProfile()
+        for host in ("github.com", "api.github.com",
+                     "github.githubassets.com", "GitHub.com"):
+            with self.subTest(host=host):
+                self.assertTrue(profile.allows(host))
+
+    def test_blocked(self) -> None:
+        profile = LeanProfile()
+        for host in ("collector.github.com", "avatars.githubusercontent.com",
+                     "www.google-analytics.com", "evilgithub.com",
+                     "github.com.example.org"):
+            with self.subTest(host=host):
+                self.assertFalse(profile.allows(host))
+
+    def test_no_blocking(self) -> None:
+        self.assertTrue(LeanProfile(allowed_hosts=None).allows(
+            "collector.github.com"))
+
+    def test_pac_script(self) -> None:
+        pac = LeanProfile().pac_script()
+        for host in GH_HOSTS:
+            with self.subTest(host=host):
+                self.assertIn(f'"{host}": true', pac)
+        self.assertIn(f"return '{BLOCKING_PROXY}'", pac)
+        pac = LeanProfile(allowed_hosts=["127.0.0.1"]).pac_script()
+        self.assertIn('var allowed = {"127.0.0.1": true};', pac)
+
+
+class ApplyTest(unittest.TestCase):
+    """Check the preferences set on the Firefox options."""
+    def test_proxy(self) -> None:
+        prefs = apply(LeanProfile()).preferences
+        self.assertEqual(prefs["network.proxy.type"], 2)
+        self.assertFalse(prefs["network.proxy.failover_direct"])
+        pac_url = prefs["network.proxy.autoconfig_url"]
+        self.assertTrue(pac_url.startswith("data:text/javascript,"))
+        self.assertEqual(unquote(pac_url.split(",", 1)[1]),
+                         LeanProfile().pac_script())
+
+    def test_no_host_blocking(self) -> None:
+        prefs = apply(LeanProfile(allowed_hosts=None)).preferences
+        for pref in ("network.proxy.type", "network.proxy.autoconfig_url",
+                     "network.proxy.failover_direct"):
+            with self.subTest(pref=pref):
+                self.assertNotIn(pref, prefs)
+
+    def test_block_flags(self) -> None:
+        flags = {
+            "block_images": {"permissions.default.image": 2},
+            "block_fonts": {"gfx.downloadable_fonts.enabled": False,
+                            "browser.display.use_document_fonts": 0},
+            "block_media": {"media.autoplay.default": 5,
+                            "media.preload.default": 0},
+        }
+        for flag, expected in flags.items():
+            with self.subTest(flag=flag):
+                on = apply(LeanProfile(**{flag: True})).preferences
+                off = apply(LeanProfile(**{flag: False})).preferences
+                for pref, value in expected.items():
+                    self.assertEqual(on[pref], value)
+                    self.assertNotIn(pref, off)
+
+    def test_page_load_strategy(self) -> None:
+        options = apply(LeanProfile())
+        self.assertEqual(options.page_load_strategy, "eager")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import random
 import unittest
 from collections import defaultdict
 from typing import *
@@ -17,7 +18,7 @@ def load_views() -> List[urls.View]:
 
 
 def setUpModule():
-    URLS = load_views()
+    URLS.extend(load_views())
 
 
 class XPathUniquenessTest(unittest.TestCase):
@@ -46,6 +47,86 @@ class PatternMatchTest(unittest.TestCase):
             with self.subTest(view=view.name):
                 self.assertIsNotNone(match, msg=msg)
 
+    def test_sample_regex_match(self) -> None:
+        for view in URLS:
+            for url in view.sample_urls(suffix_only=True):
+                match = view.pattern.search(url)
+                msg = f"Pattern mismatch for {view.name} sample {url}"
+                with self.subTest(view=view.name, url=url):
+                    self.assertIsNotNone(match, msg=msg)
+
+
+class SampleTest(unittest.TestCase):
+    """Check if samples are watched and name existing timestamps."""
+    def test_sample_timestamps(self) -> None:
+        for view in URLS:
+            names = {tsp.name for tsp in view.timestamps}
+            for sample in view.samples:
+                with self.subTest(view=view.name, params=sample.params):
+                    self.assertTrue(sample.timestamps, msg="No timestamps")
+                    self.assertLessEqual(set(sample.timestamps), names)
+
+    def test_base_sample_repo(self) -> None:
+        for view in URLS:
+            if view.type is not urls.ViewType.BASE:
+                continue
+            for sample in view.samples:
+                with self.subTest(view=view.name, params=sample.params):
+                    self.assertIsNone(sample.repo)
+
+    def test_expected_timestamps(self) -> None:
+        view = urls.View("repo", "/", r"^/?$", timestamps=[
+            urls.TS("last", "BODY/RELATIVE-TIME"),
+            urls.TS("file", "BODY/DIV/RELATIVE-TIME"),
+        ])
+        sample = urls.Sample(repo="python/cpython", timestamps=["file"])
+        self.assertEqual(view.expected_timestamps(None), view.timestamps)
+        self.assertEqual([tsp.name for tsp in view.expected_timestamps(sample)],
+                         ["file"])
+        self.assertEqual(view.sample_url(sample),
+                         "https://github.com/python/cpython/")
+        self.assertEqual(view.sample_url(urls.Sample()), view.example_url())
+
+
+class ScheduleTest(unittest.TestCase):
+    """Check grouping and sampling of view URLs."""
+    def setUp(self) -> None:
+        other = "EMPRI-DEVOPS/empri-browser-extension"
+        self.repo = urls.View("repo", "/", r"^/?$", samples=[
+            urls.Sample(repo=other),
+            urls.Sample(repo="cburkert/foo"),
+        ])
+        self.repo_dup = urls.View("repodup", "/", r"^/?$", samples=[
+            urls.Sample(repo=other),
+        ])
+        self.user = urls.View("user", "/{}", r"^/([^/]+)/?$",
+                              [urls.EXAMPLE_USER], type=urls.ViewType.BASE,
+                              samples=[urls.Sample(["octocat"])])
+
+    def test_dedup(self) -> None:
+        plan = urls.schedule([self.repo, self.repo_dup, self.user])
+        self.assertEqual(len(plan), 5)
+        main_url = self.repo.example_url()
+        self.assertEqual(plan[main_url],
+                         [(self.repo, None), (self.repo_dup, None)])
+        other_url = self.repo.sample_url(self.repo.samples[0])
+        self.assertEqual(plan[other_url],
+                         [(self.repo, self.repo.samples[0]),
+                          (self.repo_dup, self.repo_dup.samples[0])])
+        self.assertEqual(plan["https://github.com/octocat"],
+                         [(self.user, self.user.samples[0])])
+
+    def test_sampling(self) -> None:
+        plan = urls.schedule([self.repo], max_samples=1,
+                             rng=random.Random(0))
+        self.assertEqual(len(plan), 2)
+        self.assertIn(self.repo.example_url(), plan)
+        again = urls.schedule([self.repo], max_samples=1,
+                              rng=random.Random(0))
+        self.assertEqual(list(again), list(plan))
+        plan = urls.schedule([self.repo], max_samples=0)
+        self.assertEqual(list(plan), [self.repo.example_url()])
+
 
 if __name__ == "__main__":
     unittest.main()